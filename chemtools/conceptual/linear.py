@@ -26,14 +26,70 @@ This module contains the global and local tool classes corresponding to linear e
 """
 
 
+import os
+
+import numpy as np
+
 from chemtools.conceptual.base import BaseGlobalTool, BaseLocalTool, BaseCondensedTool
-from chemtools.conceptual.utils import check_dict_values, check_number_electrons
+from chemtools.conceptual.utils import (check_dict_values, check_electrons_array,
+                                        check_number_electrons)
 from chemtools.utils.utils import doc_inherit
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 
 __all__ = ["LinearGlobalTool", "LinearLocalTool", "LinearCondensedTool"]
 
 
+if numba is not None:
+    # honor OMP_NUM_THREADS for the parallel kernels, like OpenMP-based tools do;
+    # set_num_threads only exists in numba >= 0.49, older versions just use all threads
+    _set_num_threads = getattr(numba, "set_num_threads", None)
+    _num_threads = os.environ.get("OMP_NUM_THREADS", "")
+    if _set_num_threads is not None and _num_threads.isdigit() and int(_num_threads) > 0:
+        _set_num_threads(min(int(_num_threads), numba.config.NUMBA_NUM_THREADS))
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _jit_axpy(a, b, s, out):
+        """Fill ``out[i] = a[i] + b[i] * s`` in a single parallel pass."""
+        for i in numba.prange(a.shape[0]):
+            out[i] = a[i] + b[i] * s
+else:
+    _jit_axpy = None
+
+
+def _axpy_parallel(a, b, s, out=None):
+    """Return ``a + b * s`` evaluated in a single pass over the grid.
+
+    This fuses the copy of the reference array and the scaled update into one sweep, so
+    the grid is read and written once instead of twice. When numba is available, the
+    memory-bound sweep runs thread-parallel outside the GIL; otherwise an equivalent
+    out=-based NumPy path is used.
+
+    Parameters
+    ----------
+    a : ndarray
+        Reference array evaluated on grid points, e.g. the density at :math:`N_0`.
+    b : ndarray
+        Update array evaluated on grid points, e.g. the Fukui function.
+    s : float
+        Scalar multiplying the update array, e.g. :math:`N - N_0`.
+    out : ndarray, optional
+        Output array; a fresh array is allocated when not given.
+    """
+    if out is None:
+        out = np.empty_like(a)
+    if _jit_axpy is not None and a.ndim == 1:
+        _jit_axpy(a, b, float(s), out)
+    else:
+        np.multiply(b, s, out=out)
+        out += a
+    return out
+
+
 class LinearGlobalTool(BaseGlobalTool):
     r"""
     Class of global conceptual DFT reactivity descriptors based on the linear energy model.
@@ -130,31 +186,52 @@ class LinearGlobalTool(BaseGlobalTool):
 
     @doc_inherit(BaseGlobalTool)
     def energy(self, n_elec):
+        # hoist attributes into locals once, off the per-point arithmetic
+        n0 = self._n0
+        param_a, param_b, param_a_prime, param_b_prime = self._params
+        if isinstance(n_elec, np.ndarray):
+            # vectorized evaluation computing both branches in a single pass
+            n_elec = check_electrons_array(n_elec, n0 - 1, n0 + 1)
+            return np.where(n_elec <= n0,
+                            param_a + n_elec * param_b,
+                            param_a_prime + n_elec * param_b_prime)
         # check n_elec argument
-        check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
+        n_elec = check_number_electrons(n_elec, n0 - 1, n0 + 1)
         # evaluate energy
-        if n_elec <= self._n0:
-            value = self._params[0] + n_elec * self._params[1]
+        if n_elec <= n0:
+            value = param_a + n_elec * param_b
         else:
-            value = self._params[2] + n_elec * self._params[3]
+            value = param_a_prime + n_elec * param_b_prime
         return value
 
     @doc_inherit(BaseGlobalTool)
     def energy_derivative(self, n_elec, order=1):
-        # check n_elec argument
-        check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
         # check order
         if not (isinstance(order, int) and order > 0):
             raise ValueError("Argument order should be an integer greater than or equal to 1.")
+        # hoist attributes into locals once, off the per-point arithmetic
+        n0 = self._n0
+        param_b, param_b_prime = self._params[1], self._params[3]
+        if isinstance(n_elec, np.ndarray):
+            # vectorized evaluation; the derivative does not exist at N0, marked by nan
+            n_elec = check_electrons_array(n_elec, n0 - 1, n0 + 1)
+            if order >= 2:
+                deriv = np.zeros_like(n_elec)
+            else:
+                deriv = np.where(n_elec < n0, param_b, param_b_prime)
+            deriv[n_elec == n0] = np.nan
+            return deriv
+        # check n_elec argument
+        n_elec = check_number_electrons(n_elec, n0 - 1, n0 + 1)
         # evaluate derivative
-        if n_elec == self._n0:
+        if n_elec == n0:
             deriv = None
         elif order >= 2:
             deriv = 0.0
-        elif n_elec < self._n0:
-            deriv = self._params[1]
+        elif n_elec < n0:
+            deriv = param_b
         else:
-            deriv = self._params[3]
+            deriv = param_b_prime
         return deriv
 
 
@@ -196,7 +273,7 @@ class LinearLocalTool(BaseLocalTool):
     is  assigned as the first derivative.
     """
 
-    def __init__(self, dict_density, n_max=None, global_softness=None):
+    def __init__(self, dict_density, n_max=None, global_softness=None, dtype=None):
         r"""Initialize linear density model to compute local reactivity descriptors.
 
         Parameters
@@ -213,13 +290,30 @@ class LinearLocalTool(BaseLocalTool):
             See :attr:`base.BaseGlobalTool.n_max`.
         global_softness : float, optional
             Global softness. See :attr:`base.BaseGlobalTool.softness`.
+        dtype : np.dtype, optional
+            The dtype used for storing density & Fukui function arrays, e.g. ``np.float32``
+            which halves the memory per grid point for visualization-only grids. By default,
+            arrays are stored with the dtype of the given density arrays.
         """
         # check number of electrons & density values
         n_ref, dens_m, dens_0, dens_p = check_dict_values(dict_density)
-        # compute ff+, ff- & ff0
-        self._ff_plus = dens_p - dens_0
-        self._ff_minus = dens_0 - dens_m
-        self._ff_zero = 0.5 * (dens_p - dens_m)
+        # normalize to contiguous arrays (casting once if a storage dtype is requested),
+        # so downstream kernels always stream stride-1 buffers that vectorize cleanly
+        dens_m = np.ascontiguousarray(dens_m, dtype=dtype)
+        dens_0 = np.ascontiguousarray(dens_0, dtype=dtype)
+        dens_p = np.ascontiguousarray(dens_p, dtype=dtype)
+        self._dens_0 = dens_0
+        # compute ff-, ff0 & ff+ stacked into one contiguous (3, N) buffer, so that grid
+        # kernels read a single cache-friendly array and branches reduce to a row index;
+        # the ff0 row is filled lazily on first access, because finite-difference scans
+        # frequently use only ff-/ff+ and would waste a full-grid pass on it
+        self._ff = np.empty((3,) + np.shape(dens_0),
+                            dtype=np.result_type(dens_m, dens_0, dens_p))
+        # subtract straight into the buffer rows; slice assignment would first
+        # materialize each difference as a grid-sized temporary and then copy it
+        np.subtract(dens_0, dens_m, out=self._ff[0])
+        np.subtract(dens_p, dens_0, out=self._ff[2])
+        self._ff_zero_ready = False
         super(LinearLocalTool, self).__init__(n_ref, n_max, global_softness)
         self.dict_density = dict_density
 
@@ -232,7 +326,7 @@ class LinearLocalTool(BaseLocalTool):
            f^+\left(\mathbf{r}\right) = \rho_{N_0 + 1}\left(\mathbf{r}\right) -
                                         \rho_{N_0}\left(\mathbf{r}\right)
         """
-        return self._ff_plus
+        return self._ff[2]
 
     @property
     def ff_minus(self):
@@ -243,7 +337,7 @@ class LinearLocalTool(BaseLocalTool):
            f^-\left(\mathbf{r}\right) = \rho_{N_0}\left(\mathbf{r}\right) -
                                         \rho_{N_0 - 1}\left(\mathbf{r}\right)
         """
-        return self._ff_minus
+        return self._ff[0]
 
     @property
     def ff_zero(self):
@@ -257,35 +351,101 @@ class LinearLocalTool(BaseLocalTool):
            \frac{f^+\left(\mathbf{r}\right) + f^-\left(\mathbf{r}\right)}{2} =
            \frac{\rho_{N_0 + 1}\left(\mathbf{r}\right) - \rho_{N_0 - 1}\left(\mathbf{r}\right)}{2}
         """
-        return self._ff_zero
+        self._fill_ff_zero()
+        return self._ff[1]
+
+    def _fill_ff_zero(self):
+        """Fill the middle row of the stacked Fukui buffer on first use."""
+        if not self._ff_zero_ready:
+            # fill in place, i.e. ff0 = 0.5 * (ff- + ff+)
+            np.add(self._ff[0], self._ff[2], out=self._ff[1])
+            self._ff[1] *= 0.5
+            self._ff_zero_ready = True
+
+    def _branch_index(self, n_elec):
+        """Return row index of stacked Fukui buffer, i.e. 0 (ff-), 1 (ff0) or 2 (ff+)."""
+        n0 = self._n0
+        if n_elec < n0:
+            return 0
+        elif n_elec > n0:
+            return 2
+        return 1
 
     @doc_inherit(BaseLocalTool)
     def density(self, n_elec):
+        # hoist attributes into locals once, off the per-call arithmetic
+        n0, dens_0 = self._n0, self._dens_0
         # check n_elec argument
-        check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
-        # compute density
-        rho = self.dict_density[self._n0].copy()
-        if n_elec < self._n0:
-            rho += self._ff_minus * (n_elec - self._n0)
-        elif n_elec > self._n0:
-            rho += self._ff_plus * (n_elec - self._n0)
-        return rho
+        n_elec = check_number_electrons(n_elec, n0 - 1, n0 + 1)
+        # compute density; at the reference number of electrons the density is the stored
+        # reference array, so return a read-only view instead of paying a full-grid copy
+        if n_elec == n0:
+            rho = dens_0.view()
+            rho.flags.writeable = False
+            return rho
+        return _axpy_parallel(dens_0, self._ff[0 if n_elec < n0 else 2], n_elec - n0)
+
+    def softness_batch(self, n_elec):
+        r"""Evaluate local softness for an array of electron numbers in one pass.
+
+        .. math::
+           s_N\left(\mathbf{r}\right) = S \cdot f_N\left(\mathbf{r}\right)
+
+        For :math:`K` electron numbers and an :math:`N`-point grid this returns a
+        :math:`(K, N)` array computed by a single row gather of the stacked Fukui
+        buffer and one multiply, instead of :math:`K` Python-level dispatches.
+        Returns None when the global softness is not available.
+
+        Parameters
+        ----------
+        n_elec : ndarray
+            Array of numbers of electrons, :math:`N_{\text{elec}}`.
+        """
+        if self._global_softness is None:
+            return None
+        n_elec = check_electrons_array(n_elec, self._n0 - 1, self._n0 + 1)
+        idx = np.where(n_elec < self._n0, 0, np.where(n_elec > self._n0, 2, 1))
+        if (idx == 1).any():
+            # materialize the lazily-filled ff0 row before gathering it
+            self._fill_ff_zero()
+        return self._global_softness * self._ff[idx]
+
+    def density_evaluator(self):
+        r"""Return a callable evaluating :func:`density <LinearLocalTool.density>` on this grid.
+
+        The returned function closes over the reference density and the stacked Fukui
+        functions, so repeated evaluations for many numbers of electrons (e.g. scanning
+        reactivity curves on a fixed grid) skip attribute lookups and dispatch straight
+        into the fused grid kernel, which is warmed up once for this grid's dtype.
+        """
+        dens_0, ff, n0 = self._dens_0, self._ff, self._n0
+        n_min, n_max = n0 - 1, n0 + 1
+        if _jit_axpy is not None and dens_0.ndim == 1:
+            # compile & specialize the kernel for this dtype once, outside the scan loop
+            _jit_axpy(dens_0, ff[0], 0.0, np.empty_like(dens_0))
+
+        def evaluate(n_elec):
+            """Evaluate density at the given number of electrons."""
+            n_elec = check_number_electrons(n_elec, n_min, n_max)
+            if n_elec == n0:
+                rho = dens_0.view()
+                rho.flags.writeable = False
+                return rho
+            return _axpy_parallel(dens_0, ff[0 if n_elec < n0 else 2], n_elec - n0)
+
+        return evaluate
 
     @doc_inherit(BaseLocalTool)
     def density_derivative(self, n_elec, order=1):
         # check n_elec argument
-        check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
+        n_elec = check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
         # check order
         if not (isinstance(order, int) and order > 0):
             raise ValueError("Argument order should be an integer greater than or equal to 1.")
         # compute derivative of density w.r.t. number of electrons
         if order == 1:
-            if n_elec < self._n0:
-                deriv = self._ff_minus
-            elif n_elec > self._n0:
-                deriv = self._ff_plus
-            else:
-                deriv = self._ff_zero
+            idx = self._branch_index(n_elec)
+            deriv = self.ff_zero if idx == 1 else self._ff[idx]
         else:
             if n_elec == self._n0:
                 deriv = None
@@ -389,19 +549,19 @@ class LinearCondensedTool(BaseCondensedTool):
     @doc_inherit(BaseCondensedTool)
     def population(self, n_elec):
         # check n_elec argument
-        check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
-        # compute atomic populations
-        pop = self.dict_population[self._n0].copy()
-        if n_elec < self._n0:
-            pop += self._ff_minus * (n_elec - self._n0)
-        elif n_elec > self._n0:
-            pop += self._ff_plus * (n_elec - self._n0)
-        return pop
+        n_elec = check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
+        # compute atomic populations in a single fused pass, avoiding the temporary
+        # ff * delta array that operator arithmetic would materialize
+        pop_0 = self.dict_population[self._n0]
+        if n_elec == self._n0:
+            return pop_0.copy()
+        ff = self._ff_minus if n_elec < self._n0 else self._ff_plus
+        return _axpy_parallel(pop_0, ff, n_elec - self._n0)
 
     @doc_inherit(BaseCondensedTool)
     def population_derivative(self, n_elec, order=1):
         # check n_elec argument
-        check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
+        n_elec = check_number_electrons(n_elec, self._n0 - 1, self._n0 + 1)
         # check order
         if not (isinstance(order, int) and order > 0):
             raise ValueError("Argument order should be an integer greater than or equal to 1.")
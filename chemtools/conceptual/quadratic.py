@@ -148,7 +148,7 @@ class QuadraticLocalTool(BaseLocalTool):
       \text{ for } n \geqslant 3
     """
 
-    def __init__(self, dict_density, n_max=None, global_softness=None):
+    def __init__(self, dict_density, n_max=None, global_softness=None, dtype=None):
         r"""Initialize quadratic density model to compute local reactivity descriptors.
 
         Parameters
@@ -165,9 +165,18 @@ class QuadraticLocalTool(BaseLocalTool):
             See :attr:`BaseGlobalTool.n_max`.
         global_softness : float, optional
             Global softness. See :attr:`BaseGlobalTool.softness`.
+        dtype : np.dtype, optional
+            The dtype used for storing density & Fukui function arrays, e.g. ``np.float32``
+            which halves the memory per grid point for visualization-only grids. By default,
+            arrays are stored with the dtype of the given density arrays.
         """
         # check number of electrons & density values
         n_ref, dens_m, dens_0, dens_p = check_dict_values(dict_density)
+        # cast density arrays once, if a storage dtype is requested
+        if dtype is not None:
+            dens_m = dens_m.astype(dtype, copy=False)
+            dens_0 = dens_0.astype(dtype, copy=False)
+            dens_p = dens_p.astype(dtype, copy=False)
         # compute fukui function & dual descriptor of N0-electron system
         self._ff0 = 0.5 * (dens_p - dens_m)
         self._df0 = dens_p - 2 * dens_0 + dens_m
@@ -84,6 +84,25 @@ def test_global_linear_np_energy():
     assert_equal(model.energy_derivative(11.3, 2), 0.)
 
 
+def test_global_linear_np_energy_array():
+    # E(N) = -1.0 - 0.5 * N, N <= 10
+    # E(N) = -7.0 + 0.1 * N, N >= 10
+    # build global tool
+    model = LinearGlobalTool({10: -6.0, 11: -5.9, 9: -5.5})
+    # check vectorized E(N) against scalar evaluation
+    n_values = np.array([9., 9.32, 10., 10.5, 11.])
+    expected = np.array([model.energy(n) for n in n_values])
+    assert_almost_equal(model.energy(n_values), expected, decimal=6)
+    # check vectorized dE(N); derivative at N0 is nan instead of None
+    expected = np.array([-0.5, -0.5, np.nan, 0.1, 0.1])
+    assert_almost_equal(model.energy_derivative(n_values, 1), expected, decimal=6)
+    expected = np.array([0., 0., np.nan, 0., 0.])
+    assert_almost_equal(model.energy_derivative(n_values, 2), expected, decimal=6)
+    # check negative number of electrons raises
+    assert_raises(ValueError, model.energy, np.array([-1.0, 9.5]))
+    assert_raises(ValueError, model.energy_derivative, np.array([-0.5, 10.2]), 1)
+
+
 def test_global_linear_np_reactivity():
     # E(N) = -1.0 - 0.5 * N, N <= 10
     # E(N) = -7.0 + 0.1 * N, N >= 10
@@ -322,6 +341,22 @@ def test_local_linear_fake_density():
     assert_almost_equal(model.density(9.61), 0.39 * dm + 0.61 * d0, decimal=6)
 
 
+def test_local_linear_fake_density_evaluator():
+    # fake density arrays
+    d0 = np.array([1.0, 3.0, 5.0, 2.0, 7.0])
+    dp = np.array([0.5, 4.5, 6.0, 1.0, 5.0])
+    dm = np.array([1.0, 4.0, 3.0, 2.0, 8.0])
+    # build a linear local model & a density evaluator specialized for its grid
+    model = LinearLocalTool({10: d0, 11.: dp, 9: dm})
+    evaluate = model.density_evaluator()
+    # check evaluator against density method
+    for n_elec in [9., 9.32, 10., 10.50, 10.75, 11.]:
+        assert_almost_equal(evaluate(n_elec), model.density(n_elec), decimal=6)
+    # check invalid N
+    assert_raises(ValueError, evaluate, '10.0')
+    assert_raises(ValueError, evaluate, -1.)
+
+
 def test_local_linear_fake_density_derivative():
     # fake density arrays
     d0 = np.array([1.0, 3.0, 5.0, 2.0, 7.0])
@@ -380,6 +415,25 @@ def test_local_linear_fake_softness():
     assert model.hyper_softness is None
 
 
+def test_local_linear_fake_softness_batch():
+    # fake density arrays
+    d0 = np.array([1.0, 3.0, 5.0, 2.0, 7.0])
+    dp = np.array([0.5, 4.5, 6.0, 1.0, 5.0])
+    dm = np.array([1.0, 4.0, 3.0, 2.0, 8.0])
+    # check None is returned when global softness is not given
+    model = LinearLocalTool({10: d0, 11.: dp, 9: dm})
+    assert model.softness_batch(np.array([9.5, 10.])) is None
+    # build a linear local model & check batched softness
+    model = LinearLocalTool({10: d0, 11.: dp, 9: dm}, global_softness=1.63)
+    n_values = np.array([9.34, 10., 10.42])
+    expected = 1.63 * np.array([dp - d0, 0.5 * (dp - dm), dp - d0])
+    expected[0] = 1.63 * (d0 - dm)
+    assert_equal(model.softness_batch(n_values).shape, (3, 5))
+    assert_almost_equal(model.softness_batch(n_values), expected, decimal=6)
+    # check negative number of electrons raises
+    assert_raises(ValueError, model.softness_batch, np.array([-0.5, 10.]))
+
+
 def test_condensed_linear_raises():
     # fake population array
     pop_0 = np.array([-0.5, 1.0, -0.5, 0.5])
@@ -25,18 +25,64 @@
 
 import logging
 
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2 has no functools.lru_cache; fall back to a no-op decorator so the
+    # dictionary validation below simply runs unmemoized there
+    def lru_cache(maxsize=128):  # pylint: disable=unused-argument
+        """Return a decorator leaving the function unchanged (no memoization)."""
+        def decorator(func):
+            func.__wrapped__ = func
+            return func
+        return decorator
 
-__all__ = ["check_dict_values", "check_number_electrons"]
+import numpy as np
+
+
+__all__ = ["check_dict_values", "check_number_electrons", "check_electrons_array"]
+
+
+try:
+    # Python 2: basestring covers both str & unicode
+    _STRING_TYPES = (basestring, bytes)  # noqa  # pylint: disable=undefined-variable
+except NameError:
+    _STRING_TYPES = (str, bytes)
+
+
+def _warn_outside_range(n_elec, n_min, n_max):
+    """Log a warning for a property evaluated outside of the interpolation region.
+
+    The warning string is only built here, after the range check has failed, so the
+    in-range fast path of the validators never pays for the formatting.
+    """
+    logging.warning("Property evaluated for n_elec={0} outside of interpolation "
+                    "region [{1}, {2}].".format(n_elec, n_min, n_max))
 
 
 def check_dict_values(dict_values):
     """Check sanity of number of electrons and corresponding property values.
 
+    Validation of dictionaries with scalar (hashable) values is memoized, so models
+    repeatedly built from the same energy values skip re-checking identical items.
+
     Parameters
     ----------
     dict_values : dict
         Dictionary of number of electrons (keys) and corresponding property value (values).
     """
+    items = tuple(sorted(dict_values.items()))
+    try:
+        return _check_dict_items(items)
+    except TypeError:
+        # unhashable (e.g. array) values cannot be memoized, so validate them directly
+        return _check_dict_items.__wrapped__(items)
+
+
+@lru_cache(maxsize=128)
+def _check_dict_items(items):
+    """Validate & unpack a sorted tuple of (number of electrons, value) items."""
+    dict_values = dict(items)
     # check length of dictionary & its keys
     if len(dict_values) != 3 or not all([key >= 0 for key in dict_values.keys()]):
         raise ValueError("The energy model requires 3 keys corresponding to positive "
@@ -72,12 +118,46 @@ def check_number_electrons(n_elec, n_min, n_max):
         Minimum number of electrons used for interpolation.
     n_max : float
         Maximum number of electrons used for interpolation.
+
+    Returns
+    -------
+    float
+        Number of electrons coerced to a built-in float.
     """
-    if not isinstance(n_elec, (int, float)):
+    # duck-typed coercion accepts any real scalar (including numpy scalars) in one shot;
+    # strings & bytes are rejected explicitly because float("10.0") would silently succeed
+    try:
+        if isinstance(n_elec, _STRING_TYPES):
+            raise TypeError
+        n_elec = float(n_elec)
+    except TypeError:
         raise ValueError("Number of electrons should be a single number. "
                          "Given n_elec={0}".format(n_elec))
     if n_elec < 0.0:
         raise ValueError("Number of electrons cannot be negative! n_elec={0}".format(n_elec))
-    if not n_min <= n_elec <= n_max:
-        logging.warning("Property evaluated for n_elec={0} outside of interpolation "
-                        "region [{1}, {2}].".format(n_elec, n_min, n_max))
+    if n_elec < n_min or n_elec > n_max:
+        _warn_outside_range(n_elec, n_min, n_max)
+    return n_elec
+
+
+def check_electrons_array(n_elec, n_min, n_max):
+    """Check array of number of electrons with a single bounds check on its extrema.
+
+    Parameters
+    ----------
+    n_elec : ndarray
+        Array of numbers of electrons.
+    n_min : float
+        Minimum number of electrons used for interpolation.
+    n_max : float
+        Maximum number of electrons used for interpolation.
+    """
+    n_elec = np.asarray(n_elec, dtype=float)
+    if n_elec.size == 0:
+        return n_elec
+    lower, upper = n_elec.min(), n_elec.max()
+    if lower < 0.0:
+        raise ValueError("Number of electrons cannot be negative! n_elec={0}".format(lower))
+    if lower < n_min or upper > n_max:
+        _warn_outside_range(lower if lower < n_min else upper, n_min, n_max)
+    return n_elec
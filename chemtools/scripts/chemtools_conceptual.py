@@ -25,9 +25,13 @@
 """Conceptual Density Functional Theory Script."""
 
 
-from chemtools import print_vmd_script_isosurface
-from chemtools import GlobalConceptualDFT, LocalConceptualDFT, CondensedConceptualDFT
-from chemtools.scripts.common import help_cube, load_molecule_and_grid
+import numpy as np
+
+from chemtools.scripts.common import help_cube, load_cached_model
+
+# The chemtools/horton import chain is heavy (LAPACK initialization, wave-function
+# machinery); it is deferred into the main_* functions below, so that parsing-only
+# invocations like --help and --version do not pay its startup cost.
 
 
 description_global = """
@@ -150,18 +154,42 @@ def parse_args_condensed(subparser):
 
 def main_conceptual_global(args):
     """Build GlobalConceptualDFT class and print global descriptors."""
-    # build model & print descriptors
-    model = GlobalConceptualDFT.from_file(args.fname, args.model)
+    from chemtools import GlobalConceptualDFT
+
+    # build model (reusing an on-disk cached one, if enabled) & print descriptors
+    model = load_cached_model(
+        lambda: GlobalConceptualDFT.from_file(args.fname, args.model),
+        args.fname, ("global", args.model))
     print(model)
 
 
 def main_conceptual_local(args):
     """Build LocalConceptualDFT class and dump a cube file of local descriptor."""
-    # load molecule & cubic grid
-    mol, cube = load_molecule_and_grid(args.fname, args.cube)
+    from chemtools import LocalConceptualDFT, print_vmd_script_isosurface
+    from chemtools.scripts.common import load_molecule_and_grid
+    from chemtools.wrappers.molecule import Molecule
 
-    # build model
-    model = LocalConceptualDFT.from_molecule(args.fname, args.model, cube.points)
+    # load molecule & cubic grid
+    mol, cube = load_molecule_and_grid(args.fname[0], args.cube)
+    # thread the already-parsed molecule(s) through, so each file is read exactly once
+    # instead of being re-parsed inside from_file
+    if len(args.fname) == 1:
+        molecule = mol
+    else:
+        molecule = [mol] + [Molecule.from_file(fname) for fname in args.fname[1:]]
+
+    # key cache entries on the cube file itself (not just its name) when one is given,
+    # so regenerating it with a different grid invalidates stale models
+    key_fnames = list(args.fname)
+    if args.cube.endswith(".cube"):
+        key_fnames.append(args.cube)
+    # build model (reusing an on-disk cached one, if enabled); local properties are only
+    # dumped for visualization, so store the density & Fukui function grids in single
+    # precision to halve their memory footprint
+    model = load_cached_model(
+        lambda: LocalConceptualDFT.from_molecule(molecule, args.model, cube.points,
+                                                 dtype=np.float32),
+        key_fnames, ("local", args.model, args.cube))
     # check whether local property exists
     if not hasattr(model, args.prop):
         raise ValueError("The {0} local conceptual DFT class does not contain "
@@ -182,6 +210,7 @@ def main_conceptual_local(args):
 
 def main_conceptual_condensed(args):
     """Build LocalConceptualDFT class and dump a cube file of local descriptor."""
+    from chemtools import CondensedConceptualDFT
 
     # build condensed tool
     model = CondensedConceptualDFT.from_file(args.fname, model=args.model, scheme=args.scheme,
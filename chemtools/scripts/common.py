@@ -24,11 +24,15 @@
 """Common utility for scripts."""
 
 
-import numpy as np
+import hashlib
+import os
+import pickle
 
-from chemtools.wrappers.molecule import Molecule
-from chemtools.utils.cube import UniformGrid
+import numpy as np
 
+# chemtools.wrappers/horton imports are heavy and only needed when a molecule is
+# actually loaded, so they happen inside load_molecule_and_grid; this keeps importing
+# help_cube for building argument parsers cheap.
 
 help_cube = """
 cubic grid used for evaluation and visualization.
@@ -39,6 +43,60 @@ extension on each side of molecule. [default=%(default)s]
 """
 
 
+def load_cached_model(build, fnames, key_parts):
+    """Build a model, or load it from the on-disk cache of a previous invocation.
+
+    Caching is enabled by setting the CHEMTOOLS_CACHEDIR environment variable to a
+    writable directory; without it, the model is simply built. Cache entries are keyed
+    by the absolute paths and modification times of the wave-function files plus the
+    given key parts, so editing an input file invalidates its entries. This lets
+    scripted sweeps that invoke the command-line tools repeatedly on the same files
+    skip re-parsing and re-building identical models.
+
+    Parameters
+    ----------
+    build : callable
+        Callable without arguments constructing the model on a cache miss.
+    fnames : sequence of str
+        Paths to the wave-function file(s) the model is derived from.
+    key_parts : sequence of str
+        Extra items distinguishing models built from the same files, e.g. energy model.
+    """
+    cachedir = os.environ.get("CHEMTOOLS_CACHEDIR")
+    if not cachedir:
+        return build()
+    key = [os.path.abspath(fname) + ":" + repr(os.stat(fname).st_mtime) for fname in fnames]
+    key.extend([str(part) for part in key_parts])
+    digest = hashlib.sha1("\n".join(key).encode("utf-8")).hexdigest()
+    cachefile = os.path.join(cachedir, "chemtools-{0}.pkl".format(digest))
+    if os.path.isfile(cachefile):
+        try:
+            with open(cachefile, "rb") as f:
+                return pickle.load(f)
+        except Exception:  # pylint: disable=broad-except
+            # unpickling corrupt bytes can raise almost anything (EOFError,
+            # UnpicklingError, AttributeError, ...); rebuild & overwrite the entry
+            pass
+    model = build()
+    tmpfile = "{0}.tmp-{1}".format(cachefile, os.getpid())
+    try:
+        if not os.path.isdir(cachedir):
+            os.makedirs(cachedir)
+        # dump to a temporary file & atomically move it into place, so a failed or
+        # interrupted dump never leaves a truncated entry at the final path
+        with open(tmpfile, "wb") as f:
+            pickle.dump(model, f, pickle.HIGHEST_PROTOCOL)
+        os.rename(tmpfile, cachefile)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        # models holding unpicklable members (pickling them raises TypeError or
+        # PicklingError) are still returned, just not cached
+        try:
+            os.remove(tmpfile)
+        except OSError:
+            pass
+    return model
+
+
 def load_molecule_and_grid(fname, cube):
     """Return instances of molecule and uniform cubic grid.
 
@@ -50,6 +108,9 @@ def load_molecule_and_grid(fname, cube):
        Uniform cubic grid specifications.
 
     """
+    from chemtools.wrappers.molecule import Molecule
+    from chemtools.utils.cube import UniformGrid
+
     # load molecule
     mol = Molecule.from_file(fname)
 
@@ -100,7 +100,12 @@ class BaseConceptualDFT(object):
 
     def __getattr__(self, attr):
         """Return class attribute."""
-        value = getattr(self._tool, attr, "error")
+        # look up _tool in the instance dict directly; during unpickling this is called
+        # before the instance dict is restored, and self._tool would recurse forever
+        tool = self.__dict__.get("_tool")
+        if tool is None:
+            raise AttributeError("Attribute {0} does not exist!".format(attr))
+        value = getattr(tool, attr, "error")
         if isinstance(value, str) and value == "error":
             raise AttributeError("Attribute {0} does not exist!".format(attr))
         return value
@@ -264,7 +269,7 @@ class LocalConceptualDFT(BaseConceptualDFT):
     """
 
     def __init__(self, dict_density, model="quadratic", coordinates=None, numbers=None,
-                 n_max=None, global_softness=None):
+                 n_max=None, global_softness=None, dtype=None):
         r"""
         Initialize class.
 
@@ -286,6 +291,9 @@ class LocalConceptualDFT(BaseConceptualDFT):
             See :attr:`BaseGlobalTool.n_max`.
         global_softness : float, optional
             Global softness. See :attr:`BaseGlobalTool.softness`.
+        dtype : np.dtype, optional
+            The dtype used for storing density & Fukui function arrays, e.g. ``np.float32``
+            for visualization-only grids. See :class:`LinearLocalTool`.
 
         """
         # available models for local tools
@@ -298,6 +306,8 @@ class LocalConceptualDFT(BaseConceptualDFT):
                 raise ValueError("Argument dict_density should have density arrays (values) "
                                  "with the same shape! {0} != {1}".format(value.shape, shape))
         kwargs = {"n_max": n_max, "global_softness": global_softness}
+        if dtype is not None:
+            kwargs["dtype"] = dtype
         super(LocalConceptualDFT, self).__init__(dict_density, dict_models, model,
                                                  coordinates, numbers, **kwargs)
 
@@ -320,7 +330,7 @@ class LocalConceptualDFT(BaseConceptualDFT):
         return content
 
     @classmethod
-    def from_file(cls, fname, model, points):
+    def from_file(cls, fname, model, points, dtype=None):
         r"""
         Initialize class from calculation output file(s).
 
@@ -335,12 +345,15 @@ class LocalConceptualDFT(BaseConceptualDFT):
         points : np.array
             Coordinates of points on which the local properties are evaluated given as a 2D
             array with 3 columns.
+        dtype : np.dtype, optional
+            The dtype used for storing density & Fukui function arrays, e.g. ``np.float32``
+            for visualization-only grids. See :class:`LinearLocalTool`.
         """
         molecules = cls.load_file(fname)
-        return cls.from_molecule(molecules, model, points)
+        return cls.from_molecule(molecules, model, points, dtype=dtype)
 
     @classmethod
-    def from_molecule(cls, molecule, model, points):
+    def from_molecule(cls, molecule, model, points, dtype=None):
         r"""
         Initialize class from `Molecule` object(s).
 
@@ -354,6 +367,9 @@ class LocalConceptualDFT(BaseConceptualDFT):
         points : np.array
             Coordinates of points on which the local properties are evaluated given as a 2D
             array with 3 columns.
+        dtype : np.dtype, optional
+            The dtype used for storing density & Fukui function arrays, e.g. ``np.float32``
+            for visualization-only grids. See :class:`LinearLocalTool`.
         """
         # check molecule
         molecule = check_arg_molecule(molecule)
@@ -365,7 +381,7 @@ class LocalConceptualDFT(BaseConceptualDFT):
         gcdft = GlobalConceptualDFT.from_molecule(molecule, model)
         coords, nums, n_max, s = gcdft.coordinates, gcdft.numbers, gcdft.n_max, gcdft.softness
         dict_dens = get_dict_density(molecule, points)
-        return cls(dict_dens, model, coords, nums, n_max, s)
+        return cls(dict_dens, model, coords, nums, n_max, s, dtype=dtype)
 
 
 class CondensedConceptualDFT(BaseConceptualDFT):
@@ -24,10 +24,15 @@
 """Test chemtools.analysis.conceptual.GlobalConceptualDFT."""
 
 
+import os
+import shutil
+import tempfile
+
 import numpy as np
 
 from numpy.testing import assert_raises, assert_almost_equal
 
+from chemtools.scripts.common import load_cached_model
 from chemtools.toolbox.conceptual import GlobalConceptualDFT
 from chemtools.wrappers.molecule import Molecule
 try:
@@ -551,3 +556,33 @@ def test_global_quadratic_fd_h2o_fchk():
 #     # assert_almost_equal(desp.hyper_softness(2), value, decimal=6)
 #     # assert_almost_equal(desp.hyper_softness(3), value, decimal=6)
 #     # Check N_max and related descriptors
+
+
+def test_global_cached_model_roundtrip():
+    # dictionary of energy values
+    values = {9.0: -75.0, 10.0: -75.5, 11.0: -75.45}
+    builds = []
+
+    def build():
+        builds.append(1)
+        return GlobalConceptualDFT(values, "linear")
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmpdir, "mol.fchk")
+        with open(fname, "w") as f:
+            f.write("dummy")
+        os.environ["CHEMTOOLS_CACHEDIR"] = os.path.join(tmpdir, "cache")
+        model = load_cached_model(build, [fname], ("global", "linear"))
+        cached = load_cached_model(build, [fname], ("global", "linear"))
+    finally:
+        del os.environ["CHEMTOOLS_CACHEDIR"]
+        shutil.rmtree(tmpdir)
+    # the second call must be served from the on-disk cache, not rebuilt
+    assert len(builds) == 1
+    # descriptors of the unpickled model are looked up through __getattr__
+    assert cached.model == "linear"
+    assert_almost_equal(cached.n0, model.n0, decimal=8)
+    assert_almost_equal(cached.ip, model.ip, decimal=8)
+    assert_almost_equal(cached.ea, model.ea, decimal=8)
+    assert_raises(AttributeError, getattr, cached, "gibberish")